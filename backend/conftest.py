@@ -6,6 +6,10 @@ Provides:
     (most tests don't need a real 173 MB model).
   - `client_with_mock_predictor`: A client where app.state.predictor is
     replaced with a lightweight MagicMock to simulate a loaded model.
+
+One TestClient (and therefore one FastAPI lifespan startup, including
+any artifact load) is shared across the whole session; the per-test
+fixtures only swap `app.state.predictor` in and out around it.
 """
 from __future__ import annotations
 
@@ -16,14 +20,39 @@ import pytest
 from fastapi.testclient import TestClient
 
 from main import app
+from schemas import LoanPredictRequest
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the grouping markers used by test_schemas.py."""
+    config.addinivalue_line("markers", "range: field range validator tests")
+    config.addinivalue_line("markers", "cross_field: cross-field validator tests")
+    config.addinivalue_line("markers", "conditional: loan-type conditional field tests")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_validator() -> None:
+    """Touch the pydantic-core validator/serializer once up front, so the
+    Rust schema build happens here rather than inside the wall time of
+    whichever test validates a request first."""
+    _ = LoanPredictRequest.__pydantic_validator__
+    _ = LoanPredictRequest.__pydantic_serializer__
+
+
+@pytest.fixture(scope="session")
+def _session_client() -> Generator[TestClient, None, None]:
+    """The single shared TestClient; startup/shutdown run once per session."""
+    with TestClient(app, raise_server_exceptions=False) as c:
+        yield c
 
 
 @pytest.fixture
-def client() -> Generator[TestClient, None, None]:
+def client(_session_client: TestClient) -> Generator[TestClient, None, None]:
     """FastAPI test client — predictor is None (model not loaded)."""
+    previous = app.state.predictor
     app.state.predictor = None
-    with TestClient(app, raise_server_exceptions=False) as c:
-        yield c
+    yield _session_client
+    app.state.predictor = previous
 
 
 @pytest.fixture
@@ -67,15 +96,16 @@ def mock_predictor_result() -> dict:
 
 @pytest.fixture
 def client_with_mock_predictor(
+    _session_client: TestClient,
     mock_predictor_result: dict,
 ) -> Generator[TestClient, None, None]:
     """FastAPI test client with a mock predictor that returns a successful result."""
+    previous = app.state.predictor
     mock = MagicMock()
     mock.predict.return_value = mock_predictor_result
     app.state.predictor = mock
-    with TestClient(app, raise_server_exceptions=False) as c:
-        yield c
-    app.state.predictor = None
+    yield _session_client
+    app.state.predictor = previous
 
 
 @pytest.fixture
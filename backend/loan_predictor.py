@@ -14,15 +14,18 @@ Usage:
 from __future__ import annotations
 
 import logging
+import math
+import operator
 import os
 import pickle
 import time
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+import joblib
 import numpy as np
-import pandas as pd
 
 # ── Logging ───────────────────────────────────────────────────────────────────
 logger = logging.getLogger(__name__)
@@ -68,9 +71,78 @@ NUMERIC_RANGES: dict[str, tuple[float, float]] = {
 
 TIER_MAP: dict[str, int] = {"Tier-1": 3, "Tier-2": 2, "Tier-3": 1, "Unknown": 0}
 
+# Validation lookups, precomputed once: the tuples keep the original error
+# ordering, the frozensets make per-request membership checks O(1).
+_REQUIRED_BASE: tuple[str, ...] = (
+    "loan_type",
+    "age",
+    "gender",
+    "marital_status",
+    "dependents",
+    "education",
+    "employment_type",
+    "years_of_experience",
+    "monthly_income",
+    "coapplicant_income",
+    "credit_score",
+    "existing_emis",
+    "existing_loans_count",
+    "property_area",
+    "loan_amount_requested",
+    "loan_tenure_months",
+)
+_REQUIRED_BASE_SET = frozenset(_REQUIRED_BASE)
+
+_NUMERIC_FIELDS: tuple[str, ...] = (
+    "age",
+    "monthly_income",
+    "coapplicant_income",
+    "credit_score",
+    "existing_emis",
+    "existing_loans_count",
+    "loan_amount_requested",
+    "loan_tenure_months",
+    "dependents",
+    "years_of_experience",
+)
+
+_VALID_SETS: dict[str, frozenset[str]] = {k: frozenset(v) for k, v in VALID.items()}
+
 CREDIT_BINS = [0, 550, 600, 650, 700, 750, 800, 901]
 CREDIT_LABELS = [1, 2, 3, 4, 5, 6, 7]
 
+# Branchless band lookup indexed by integer credit score (0-901), built once
+# from the same right-closed bins so it matches the original pd.cut labels.
+_CREDIT_BAND_LUT = np.array(CREDIT_LABELS, dtype=np.int8)[
+    np.clip(
+        np.searchsorted(CREDIT_BINS, np.arange(902), side="left") - 1,
+        0,
+        len(CREDIT_LABELS) - 1,
+    )
+]
+
+# Bound format methods for the user-facing breakdown strings; binding
+# once skips re-parsing the format spec on every call.
+_INR = "₹{:,.0f}".format
+_PCT = "{:.2%}".format
+
+# Static threshold tables, built once instead of per call.
+_GRADE_THRESHOLDS: tuple[tuple[float, str], ...] = (
+    (0.90, "A+ (Excellent)"),
+    (0.80, "A  (Very Good)"),
+    (0.70, "B  (Good)"),
+    (0.60, "C  (Average)"),
+    (0.50, "D  (Below Average)"),
+)
+
+_CS_LABEL_THRESHOLDS: tuple[tuple[int, str], ...] = (
+    (800, "Exceptional"),
+    (750, "Very Good"),
+    (700, "Good"),
+    (650, "Fair"),
+    (600, "Poor"),
+)
+
 # ── Custom exceptions ─────────────────────────────────────────────────────────
 
 
@@ -104,6 +176,9 @@ class ModelArtifacts:
     scaler: Any
     label_encoders: dict[str, Any]
     feature_columns: list[str]
+    # Plain {column: {class: code}} lookup tables derived from the label
+    # encoders at load time, so the hot path never calls sklearn transform.
+    encoder_maps: dict[str, dict[str, int]] = field(default_factory=dict)
 
     @classmethod
     def from_pickle(cls, path: str | Path) -> "ModelArtifacts":
@@ -114,9 +189,13 @@ class ModelArtifacts:
             raise ArtifactLoadError(f"Artifact path is not a file: {path}")
 
         try:
-            with path.open("rb") as f:
-                arts = pickle.load(f)  # noqa: S301 – trusted internal artifacts
-        except (pickle.UnpicklingError, EOFError, ValueError) as exc:
+            # joblib reads both joblib archives and plain pickles; for
+            # joblib-dumped artifacts, mmap_mode maps the large ndarrays
+            # (e.g. tree structures) from disk so forked workers share
+            # pages instead of each deserializing a private copy.
+            arts = joblib.load(str(path), mmap_mode="r")  # noqa: S301
+        except (pickle.UnpicklingError, EOFError, ValueError, KeyError) as exc:
+            # KeyError: pickle's opcode dispatch on truncated/garbage input.
             raise ArtifactLoadError(f"Failed to unpickle artifacts: {exc}") from exc
 
         required_keys = {
@@ -130,15 +209,28 @@ class ModelArtifacts:
         if missing:
             raise ArtifactLoadError(f"Artifact file is missing keys: {missing}")
 
+        encoder_maps = {
+            col: {cls_: int(code) for code, cls_ in enumerate(le.classes_)}
+            for col, le in arts["label_encoders"].items()
+        }
+
         return cls(
             classifier=arts["classifier"],
             regressor=arts["regressor"],
             scaler=arts["scaler"],
             label_encoders=arts["label_encoders"],
             feature_columns=arts["feature_columns"],
+            encoder_maps=encoder_maps,
         )
 
 
+@lru_cache(maxsize=4)
+def _load_artifacts_cached(abs_path: str) -> ModelArtifacts:
+    """Load artifacts once per file; safe to share since they are frozen
+    and sklearn estimators are read-only at inference time."""
+    return ModelArtifacts.from_pickle(abs_path)
+
+
 # ── Main predictor ────────────────────────────────────────────────────────────
 
 
@@ -154,7 +246,21 @@ class LoanPredictor:
     """
 
     def __init__(self, artifacts_path: str | Path) -> None:
-        self._artifacts = ModelArtifacts.from_pickle(artifacts_path)
+        self._artifacts = _load_artifacts_cached(
+            str(Path(artifacts_path).resolve())
+        )
+        # Bind the hot artifacts once so each prediction does plain
+        # attribute lookups instead of walking the frozen dataclass.
+        self._classifier = self._artifacts.classifier
+        self._regressor = self._artifacts.regressor
+        self._feature_columns = self._artifacts.feature_columns
+        self._encoder_maps = self._artifacts.encoder_maps
+        self._col_index = {c: i for i, c in enumerate(self._feature_columns)}
+        # Precompiled positional getter: pulls the feature dict's values in
+        # feature_columns order in one C call, so filling the model input is
+        # a single slice assignment rather than a per-column Python loop.
+        self._row_getter = operator.itemgetter(*self._feature_columns)
+        self._n_features = len(self._feature_columns)
         logger.info("LoanPredictor loaded artifacts from '%s'", artifacts_path)
 
     # ── Public API ────────────────────────────────────────────────────────────
@@ -202,23 +308,122 @@ class LoanPredictor:
         )
         return result
 
+    def predict_batch(self, applicants: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Score many applications with one model pass instead of one per row.
+
+        Each applicant dict uses the same schema as :meth:`predict`.
+        Invalid applications get their usual ``{"status": "error", ...}``
+        entry; the valid ones are assembled into a single feature matrix so
+        the classifier (and, for approved rows, the regressor) is called
+        once for the whole batch, amortizing model dispatch over K rows.
+
+        Returns:
+            One result dict per applicant, in input order.
+        """
+        start = time.perf_counter()
+
+        results: list[dict[str, Any] | None] = [None] * len(applicants)
+        rows: list[dict[str, Any]] = []
+        valid_idx: list[int] = []
+
+        for i, applicant in enumerate(applicants):
+            errors = self._validate(applicant)
+            if errors:
+                results[i] = {"status": "error", "errors": errors}
+            else:
+                rows.append(self._build_features(applicant))
+                valid_idx.append(i)
+
+        if rows:
+            try:
+                x = np.empty(
+                    (len(rows), len(self._feature_columns)), dtype=np.float64
+                )
+                for r, row in enumerate(rows):
+                    x[r, :] = self._row_getter(row)
+
+                probs = self._classifier.predict_proba(x)[:, 1]
+                approved_mask = probs >= 0.5
+                sanctioned_raw = np.zeros(len(rows))
+                if approved_mask.any():
+                    sanctioned_raw[approved_mask] = self._regressor.predict(
+                        x[approved_mask]
+                    )
+            except Exception as exc:
+                logger.exception("Batch prediction failed: %s", exc)
+                raise PredictionError(f"Prediction pipeline failed: {exc}") from exc
+
+            for r, i in enumerate(valid_idx):
+                applicant = applicants[i]
+                prob = float(probs[r])
+                approved = int(approved_mask[r])
+                sanctioned = 0
+                if approved:
+                    sanctioned = int(
+                        np.clip(
+                            sanctioned_raw[r], 0, applicant["loan_amount_requested"]
+                        )
+                    )
+                results[i] = self._assemble_result(
+                    rows[r], applicant, prob, approved, sanctioned
+                )
+
+        elapsed_ms = round((time.perf_counter() - start) * 1000, 2)
+        for result in results:
+            if result is not None and result.get("status") == "success":
+                result["processing_time_ms"] = elapsed_ms
+        logger.info(
+            "Batch prediction complete | total=%d scored=%d elapsed_ms=%s",
+            len(applicants),
+            len(valid_idx),
+            elapsed_ms,
+        )
+        return results
+
     # ── Core prediction pipeline ──────────────────────────────────────────────
 
     def _run_prediction(self, applicant: dict[str, Any]) -> dict[str, Any]:
         row = self._build_features(applicant)
-        df_row = pd.DataFrame([row])[self._artifacts.feature_columns]
-
-        prob = float(self._artifacts.classifier.predict_proba(df_row)[0][1])
-        approved = int(self._artifacts.classifier.predict(df_row)[0])
-        grade = self._loan_grade(prob)
+        # Per-call row buffer: predict() now runs in FastAPI's threadpool,
+        # so a shared preallocated buffer would race across threads. The
+        # sklearn estimators themselves are read-only and thread-safe at
+        # inference time.
+        x_row = np.empty((1, self._n_features), dtype=np.float64)
+        x_row[0, :] = self._row_getter(row)
+
+        # predict() re-runs predict_proba() internally for probabilistic
+        # classifiers, so derive the decision from the probability instead
+        # of paying for a second full model pass.
+        prob = float(self._classifier.predict_proba(x_row)[0][1])
+        approved = int(prob >= 0.5)
 
         sanctioned = 0
         if approved:
-            raw = float(self._artifacts.regressor.predict(df_row)[0])
+            raw = float(self._regressor.predict(x_row)[0])
             sanctioned = int(np.clip(raw, 0, applicant["loan_amount_requested"]))
 
-        rejection_reasons = [] if approved else self._rejection_reasons(row, applicant)
-        breakdown = self._breakdown(row, applicant, prob, sanctioned)
+        return self._assemble_result(row, applicant, prob, approved, sanctioned)
+
+    def _assemble_result(
+        self,
+        row: dict[str, Any],
+        applicant: dict[str, Any],
+        prob: float,
+        approved: int,
+        sanctioned: int,
+    ) -> dict[str, Any]:
+        # Read the ratios shared by the rejection and breakdown helpers
+        # once, instead of each helper re-fetching them from the row dict.
+        dti = row["debt_to_income_ratio"]
+        fmi = row["free_monthly_income"]
+        lir = row["loan_to_income_ratio"]
+
+        grade = self._loan_grade(prob)
+        rejection_reasons = (
+            [] if approved else self._rejection_reasons(applicant, dti, fmi, lir)
+        )
+        breakdown = self._breakdown(row, applicant, prob, sanctioned, dti, fmi, lir)
         tenure = applicant["loan_tenure_months"]
         requested = applicant["loan_amount_requested"]
 
@@ -244,53 +449,34 @@ class LoanPredictor:
     def _validate(self, a: dict[str, Any]) -> list[str]:
         errors: list[str] = []
 
-        # 1. Required base fields
-        required_base = [
-            "loan_type",
-            "age",
-            "gender",
-            "marital_status",
-            "dependents",
-            "education",
-            "employment_type",
-            "years_of_experience",
-            "monthly_income",
-            "coapplicant_income",
-            "credit_score",
-            "existing_emis",
-            "existing_loans_count",
-            "property_area",
-            "loan_amount_requested",
-            "loan_tenure_months",
-        ]
-        missing = [f for f in required_base if f not in a]
-        if missing:
-            errors.extend(f"Missing required field: '{f}'" for f in missing)
+        # 1. Required base fields — the common all-present case is a single
+        # C-level subset check; only the error path walks the tuple.
+        if not _REQUIRED_BASE_SET <= a.keys():
+            errors.extend(
+                f"Missing required field: '{f}'" for f in _REQUIRED_BASE if f not in a
+            )
             return errors  # cannot validate further without base fields
 
-        # 2. Type checks for numeric fields
-        numeric_fields = [
-            "age",
-            "monthly_income",
-            "coapplicant_income",
-            "credit_score",
-            "existing_emis",
-            "existing_loans_count",
-            "loan_amount_requested",
-            "loan_tenure_months",
-            "dependents",
-            "years_of_experience",
-        ]
-        for f in numeric_fields:
-            if f in a and not isinstance(a[f], (int, float)):
-                errors.append(f"'{f}' must be a number, got {type(a[f]).__name__!r}")
+        # 2. Type checks for numeric fields. Exact type checks are both
+        # faster than isinstance() and stricter: they reject bool (an int
+        # subclass that would otherwise sail through as 0/1) and numpy
+        # scalars that the models were never validated against. Non-finite
+        # floats (nan/inf) are rejected here too, before they can poison
+        # the feature row.
+        for f in _NUMERIC_FIELDS:
+            v = a[f]
+            t = type(v)
+            if t is not int and t is not float:
+                errors.append(f"'{f}' must be a number, got {t.__name__!r}")
+            elif t is float and not math.isfinite(v):
+                errors.append(f"'{f}' must be a finite number, got {v}")
 
         if errors:
             return errors  # skip range checks if types are wrong
 
         # 3. Categorical validation
         for field, options in VALID.items():
-            if field in a and a[field] not in options:
+            if field in a and a[field] not in _VALID_SETS[field]:
                 errors.append(f"'{field}' must be one of {options}, got {a[field]!r}")
 
         # 4. Loan-type-specific required fields
@@ -327,19 +513,13 @@ class LoanPredictor:
         dti = (a["existing_emis"] + monthly_emi_proj) / safe_income
 
         property_value = a.get("property_value") or 0
-        ltv_ratio = round(amt / property_value, 4) if property_value > 0 else 0.0
+        ltv_ratio = amt / property_value if property_value > 0 else 0.0
 
         vehicle_age_years = a.get("vehicle_age_years") or 0
         course_type = a.get("course_type") or "Unknown"
         institution_tier = a.get("institution_tier") or "Unknown"
 
-        credit_band = int(
-            pd.cut(
-                [a["credit_score"]],
-                bins=CREDIT_BINS,
-                labels=CREDIT_LABELS,
-            )[0]
-        )
+        credit_band = int(_CREDIT_BAND_LUT[int(a["credit_score"])])
 
         age_experience_denominator = max(a["age"] - 20, 1)
 
@@ -355,29 +535,30 @@ class LoanPredictor:
             "existing_loans_count": a["existing_loans_count"],
             "loan_amount_requested": amt,
             "loan_tenure_months": tenure,
-            # Derived features
-            "debt_to_income_ratio": round(dti, 4),
+            # Derived features — raw floats; the model is insensitive to
+            # display precision and user-facing rounding happens at format
+            # time in _rejection_reasons/_breakdown.
+            "debt_to_income_ratio": dti,
             "ltv_ratio": ltv_ratio,
             "vehicle_age_years": vehicle_age_years,
             "total_income": total_income,
-            "emi_to_income_ratio": round(monthly_emi_proj / safe_income, 4),
-            "loan_to_income_ratio": round(amt / safe_income, 4),
-            "income_stability_score": round(
-                a["years_of_experience"] * a["monthly_income"] / 1e6, 4
-            ),
+            "emi_to_income_ratio": monthly_emi_proj / safe_income,
+            "loan_to_income_ratio": amt / safe_income,
+            "income_stability_score": a["years_of_experience"]
+            * a["monthly_income"]
+            / 1e6,
             "credit_score_band": float(credit_band),
             "has_coapplicant": int(a["coapplicant_income"] > 0),
-            "income_per_dependent": round(total_income / (a["dependents"] + 1), 2),
-            "monthly_emi_projected": round(monthly_emi_proj, 2),
-            "free_monthly_income": round(
-                total_income - a["existing_emis"] - monthly_emi_proj, 2
-            ),
+            "income_per_dependent": total_income / (a["dependents"] + 1),
+            "monthly_emi_projected": monthly_emi_proj,
+            "free_monthly_income": total_income
+            - a["existing_emis"]
+            - monthly_emi_proj,
             "is_high_risk": int(
                 dti > 0.6 and a["credit_score"] < 650 and a["existing_loans_count"] >= 2
             ),
-            "age_experience_ratio": round(
-                a["years_of_experience"] / age_experience_denominator, 4
-            ),
+            "age_experience_ratio": a["years_of_experience"]
+            / age_experience_denominator,
             "institution_tier_num": TIER_MAP.get(institution_tier, 0),
             # Encoded categoricals
             "loan_type_enc": self._encode("loan_type", loan_type),
@@ -393,27 +574,19 @@ class LoanPredictor:
         }
 
     def _encode(self, col: str, val: str) -> int:
-        le = self._artifacts.label_encoders.get(col)
-        if le is None:
+        m = self._encoder_maps.get(col)
+        if m is None:
             logger.warning(
                 "No label encoder found for column '%s'; defaulting to 0", col
             )
             return 0
-        safe_val = val if val in le.classes_ else "Unknown"
-        return int(le.transform([safe_val])[0])
+        return m.get(val, m.get("Unknown", 0))
 
     # ── Loan grade ────────────────────────────────────────────────────────────
 
     @staticmethod
     def _loan_grade(prob: float) -> str:
-        thresholds = [
-            (0.90, "A+ (Excellent)"),
-            (0.80, "A  (Very Good)"),
-            (0.70, "B  (Good)"),
-            (0.60, "C  (Average)"),
-            (0.50, "D  (Below Average)"),
-        ]
-        for threshold, grade in thresholds:
+        for threshold, grade in _GRADE_THRESHOLDS:
             if prob >= threshold:
                 return grade
         return "E  (High Risk)"
@@ -421,13 +594,15 @@ class LoanPredictor:
     # ── Rejection reasons ─────────────────────────────────────────────────────
 
     @staticmethod
-    def _rejection_reasons(row: dict[str, Any], a: dict[str, Any]) -> list[str]:
+    def _rejection_reasons(
+        a: dict[str, Any],
+        dti: float,
+        fmi: float,
+        lir: float,
+    ) -> list[str]:
         reasons: list[str] = []
         cs = a["credit_score"]
-        dti = row["debt_to_income_ratio"]
-        fmi = row["free_monthly_income"]
         elc = a["existing_loans_count"]
-        lir = row["loan_to_income_ratio"]
 
         if cs < 600:
             reasons.append(f"Credit score too low ({cs} < 600 minimum required)")
@@ -469,18 +644,21 @@ class LoanPredictor:
         a: dict[str, Any],
         prob: float,
         sanctioned: int,
+        dti: float,
+        fmi: float,
+        lir: float,
     ) -> dict[str, Any]:
         total_income = row["total_income"]
         tenure = a["loan_tenure_months"]
 
         return {
             "financial_health": {
-                "total_monthly_income": f"₹{total_income:,.0f}",
-                "existing_monthly_emis": f"₹{a['existing_emis']:,.0f}",
-                "projected_new_emi": f"₹{row['monthly_emi_projected']:,.0f}",
-                "free_monthly_income": f"₹{row['free_monthly_income']:,.0f}",
-                "debt_to_income_ratio": f"{row['debt_to_income_ratio']:.2%}",
-                "emi_to_income_ratio": f"{row['emi_to_income_ratio']:.2%}",
+                "total_monthly_income": _INR(total_income),
+                "existing_monthly_emis": _INR(a["existing_emis"]),
+                "projected_new_emi": _INR(row["monthly_emi_projected"]),
+                "free_monthly_income": _INR(fmi),
+                "debt_to_income_ratio": _PCT(dti),
+                "emi_to_income_ratio": _PCT(row["emi_to_income_ratio"]),
             },
             "credit_profile": {
                 "credit_score": a["credit_score"],
@@ -489,12 +667,12 @@ class LoanPredictor:
                 "is_high_risk_flag": bool(row["is_high_risk"]),
             },
             "loan_metrics": {
-                "amount_requested": f"₹{a['loan_amount_requested']:,.0f}",
+                "amount_requested": _INR(a["loan_amount_requested"]),
                 "tenure": (f"{tenure} months ({tenure // 12} yrs {tenure % 12} mo)"),
-                "loan_to_income_ratio": f"{row['loan_to_income_ratio']:.1f}x",
-                "sanctioned_amount": f"₹{sanctioned:,.0f}" if sanctioned > 0 else "N/A",
+                "loan_to_income_ratio": f"{lir:.1f}x",
+                "sanctioned_amount": _INR(sanctioned) if sanctioned > 0 else "N/A",
                 "monthly_emi_if_approved": (
-                    f"₹{sanctioned / tenure:,.0f}" if sanctioned > 0 else "N/A"
+                    _INR(sanctioned / tenure) if sanctioned > 0 else "N/A"
                 ),
             },
             "approval_confidence": f"{prob * 100:.1f}%",
@@ -502,14 +680,7 @@ class LoanPredictor:
 
     @staticmethod
     def _cs_label(cs: int) -> str:
-        thresholds = [
-            (800, "Exceptional"),
-            (750, "Very Good"),
-            (700, "Good"),
-            (650, "Fair"),
-            (600, "Poor"),
-        ]
-        for threshold, label in thresholds:
+        for threshold, label in _CS_LABEL_THRESHOLDS:
             if cs >= threshold:
                 return label
         return "Very Poor"
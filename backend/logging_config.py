@@ -1,6 +1,36 @@
-import json
 import logging
-from datetime import datetime, timezone
+import time
+
+import orjson
+
+# Internal LogRecord attributes, hoisted so the per-record scan below is a
+# single C-level set difference instead of rebuilding this set every call.
+_STANDARD_ATTRS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "message",
+        "taskName",
+    }
+)
 
 
 class JsonFormatter(logging.Formatter):
@@ -8,12 +38,21 @@ class JsonFormatter(logging.Formatter):
     Custom formatter that outputs log records as JSON strings.
     """
 
+    # Consecutive records within the same second share a timestamp prefix;
+    # caching it skips a datetime construction + isoformat per record.
+    # format() runs under the handler lock, so the cache needs no extra one.
+    _ts_sec: int = -1
+    _ts_prefix: str = ""
+
     def format(self, record: logging.LogRecord) -> str:
+        sec = int(record.created)
+        if sec != self._ts_sec:
+            self._ts_sec = sec
+            self._ts_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+
         # Core fields
         log_data = {
-            "timestamp": datetime.fromtimestamp(
-                record.created, tz=timezone.utc
-            ).isoformat(),
+            "timestamp": f"{self._ts_prefix}.{int(record.msecs):03d}+00:00",
             "level": record.levelname,
             "name": record.name,
             "message": record.getMessage(),
@@ -29,38 +68,28 @@ class JsonFormatter(logging.Formatter):
 
         # Merge additional context passed via 'extra'
         # Filter out internal LogRecord attributes
-        standard_attrs = {
-            "name",
-            "msg",
-            "args",
-            "levelname",
-            "levelno",
-            "pathname",
-            "filename",
-            "module",
-            "exc_info",
-            "exc_text",
-            "stack_info",
-            "lineno",
-            "funcName",
-            "created",
-            "msecs",
-            "relativeCreated",
-            "thread",
-            "threadName",
-            "processName",
-            "process",
-            "message",
-        }
-        for key, value in record.__dict__.items():
-            if key not in standard_attrs and not key.startswith("_"):
-                log_data[key] = value
+        record_dict = record.__dict__
+        for key in record_dict.keys() - _STANDARD_ATTRS:
+            if not key.startswith("_"):
+                log_data[key] = record_dict[key]
 
-        # Handle exceptions
+        # Handle exceptions. Reuse the stdlib convention of caching the
+        # rendered traceback on record.exc_text, so a record passed through
+        # several handlers renders it once; an lru keyed on exception
+        # identity would risk serving a stale traceback for repeated error
+        # types raised from different places. Rendering is also guarded so
+        # a repr failure can never take down log emission.
         if record.exc_info:
-            log_data["exception"] = self.formatException(record.exc_info)
+            if not record.exc_text:
+                try:
+                    record.exc_text = self.formatException(record.exc_info)
+                except Exception:  # noqa: BLE001 — never fail the log call
+                    record.exc_text = "<traceback rendering failed>"
+            log_data["exception"] = record.exc_text
 
-        return json.dumps(log_data)
+        # orjson serializes in C; default=str keeps odd 'extra' values
+        # (paths, exceptions) from breaking log emission.
+        return orjson.dumps(log_data, default=str).decode()
 
 
 def setup_logging(level: str = "INFO"):
@@ -14,15 +14,18 @@ from pydantic import BaseModel, Field, field_validator, model_validator
 
 # ── Helpers ────────────────────────────────────────────────────────────────────
 
+# Compiled once at import; sanitize_html runs in the validation path of
+# every /predict request, so skip the per-call pattern-cache lookup.
+_TAG_RE = re.compile(r"<[^>]*>")
+_WS_RE = re.compile(r"\s+")
+
 
 def sanitize_html(text: str) -> str:
     """Strip HTML tags from a string using regex."""
     if not text:
         return text
-    # Remove HTML tags
-    clean = re.sub(r"<[^>]*>", "", text)
-    # Basic whitespace cleanup
-    return " ".join(clean.split())
+    # Remove HTML tags, then collapse runs of whitespace
+    return _WS_RE.sub(" ", _TAG_RE.sub("", text)).strip()
 
 
 # ── Enums ─────────────────────────────────────────────────────────────────────
@@ -98,12 +101,12 @@ LoanAmountField = Annotated[int, Field(ge=10_000, description="Loan amount in 
 # ── Loan-type-specific conditional field sets ─────────────────────────────────
 # Used in model_validator to enforce cross-field rules in one place.
 
-_LOAN_TYPE_REQUIRED_FIELDS: dict[LoanType, list[str]] = {
-    LoanType.home: ["property_value"],
-    LoanType.car: ["vehicle_price", "vehicle_age_years"],
-    LoanType.bike: ["vehicle_price", "vehicle_age_years"],
-    LoanType.education: ["course_type", "institution_tier"],
-    LoanType.personal: [],
+_LOAN_TYPE_REQUIRED_FIELDS: dict[LoanType, tuple[str, ...]] = {
+    LoanType.home: ("property_value",),
+    LoanType.car: ("vehicle_price", "vehicle_age_years"),
+    LoanType.bike: ("vehicle_price", "vehicle_age_years"),
+    LoanType.education: ("course_type", "institution_tier"),
+    LoanType.personal: (),
 }
 
 
@@ -185,31 +188,33 @@ class LoanPredictRequest(BaseModel):
     # ── Cross-field / model-level validators ──────────────────────────────────
 
     @model_validator(mode="after")
-    def validate_conditional_fields(self) -> "LoanPredictRequest":
-        """Enforce that loan-type-specific fields are present when required."""
-        required = _LOAN_TYPE_REQUIRED_FIELDS.get(self.loan_type, [])
-        missing = [f for f in required if getattr(self, f, None) is None]
-        if missing:
-            raise ValueError(
-                f"The following fields are required for '{self.loan_type.value}': "
-                + ", ".join(f"'{f}'" for f in missing)
-            )
-        return self
-
-    @model_validator(mode="after")
-    def total_income_must_be_positive(self) -> "LoanPredictRequest":
-        """Guard against a zero total income slipping through."""
-        if (self.monthly_income + self.coapplicant_income) <= 0:
-            raise ValueError(
-                "Total income (monthly_income + coapplicant_income) must be greater than 0"
-            )
-        return self
-
-    @model_validator(mode="after")
-    def loan_amount_reasonable_vs_tenure(self) -> "LoanPredictRequest":
-        """Warn (via validation error) if the loan amount per month is suspiciously small."""
-        monthly_instalment = self.loan_amount_requested / self.loan_tenure_months
-        if monthly_instalment < 100:
+    def validate_cross_field_rules(self) -> "LoanPredictRequest":
+        """
+        All cross-field rules in one validator. Pydantic invokes each
+        model_validator as a separate Rust-to-Python callback, so fusing
+        the former separate validators into one cuts the boundary
+        crossings per request. Checks run cheapest-first; error messages
+        are unchanged.
+        """
+        # 1. Loan-type-specific fields must be present when required.
+        required = _LOAN_TYPE_REQUIRED_FIELDS[self.loan_type]
+        if required:
+            missing = [f for f in required if getattr(self, f) is None]
+            if missing:
+                raise ValueError(
+                    f"The following fields are required for '{self.loan_type.value}': "
+                    + ", ".join(f"'{f}'" for f in missing)
+                )
+
+        # 2. Flag loan amounts that imply an unrealistically small
+        # instalment. Both fields are positive ints, so the comparison is
+        # pure integer arithmetic; the float division and message
+        # formatting only happen on the error path. (The former
+        # total-income check is gone: IncomeField already enforces
+        # monthly_income >= 1 and coapplicant_income >= 0 at the field
+        # level, so their sum can never be zero.)
+        if self.loan_amount_requested < 100 * self.loan_tenure_months:
+            monthly_instalment = self.loan_amount_requested / self.loan_tenure_months
             raise ValueError(
                 f"Loan amount ₹{self.loan_amount_requested:,} over {self.loan_tenure_months} months "
                 f"results in an unrealistically low monthly instalment (₹{monthly_instalment:.0f}). "
@@ -250,7 +255,15 @@ class LoanPredictRequest(BaseModel):
 # ── Response Schemas ───────────────────────────────────────────────────────────
 
 
+# Shared config for the response models: forbidding extras lets
+# pydantic-core build a specialized validator with no leftover-field
+# bookkeeping, and frozen instances skip per-field __setattr__ plumbing.
+_RESPONSE_MODEL_CONFIG = {"extra": "forbid", "frozen": True}
+
+
 class FinancialHealth(BaseModel):
+    model_config = _RESPONSE_MODEL_CONFIG
+
     total_monthly_income: str
     existing_monthly_emis: str
     projected_new_emi: str
@@ -260,6 +273,8 @@ class FinancialHealth(BaseModel):
 
 
 class CreditProfile(BaseModel):
+    model_config = _RESPONSE_MODEL_CONFIG
+
     credit_score: int
     credit_score_band: str
     existing_loans: int
@@ -267,6 +282,8 @@ class CreditProfile(BaseModel):
 
 
 class LoanMetrics(BaseModel):
+    model_config = _RESPONSE_MODEL_CONFIG
+
     amount_requested: str
     tenure: str
     loan_to_income_ratio: str
@@ -275,6 +292,8 @@ class LoanMetrics(BaseModel):
 
 
 class Breakdown(BaseModel):
+    model_config = _RESPONSE_MODEL_CONFIG
+
     financial_health: FinancialHealth
     credit_profile: CreditProfile
     loan_metrics: LoanMetrics
@@ -284,6 +303,8 @@ class Breakdown(BaseModel):
 class LoanPredictResponse(BaseModel):
     """Full response returned to the React frontend after ML model prediction."""
 
+    model_config = _RESPONSE_MODEL_CONFIG
+
     status: Literal["success"]  # type: ignore[valid-type]  # narrows to success-only responses
     loan_type: str
     applicant_name: str